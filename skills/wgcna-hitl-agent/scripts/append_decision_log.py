@@ -30,10 +30,13 @@ Example:
 from __future__ import annotations
 
 import argparse
-from datetime import datetime
+import os
 from pathlib import Path
 
 
+LOG_HEADER = "# WGCNA Decision Log\n\n"
+
+
 def _bulletize(values: list[str]) -> str:
     return "\n".join(f"- {v.strip()}" for v in values if v.strip())
 
@@ -111,17 +114,36 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def ensure_header(path: Path) -> None:
-    if path.exists():
-        return
-    header = "# WGCNA Decision Log\n\n"
-    path.write_text(header, encoding="utf-8")
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def append_entry(path: Path, entry: str) -> None:
+    """Append an entry (plus the header for a new log) with one write.
+
+    Creating the log with O_EXCL decides atomically which invocation owns the
+    header, so concurrent first appends cannot both write it.
+    """
+    flags = os.O_WRONLY | os.O_APPEND
+    try:
+        fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, 0o666)
+        prefix = LOG_HEADER + "\n"
+    except FileExistsError:
+        fd = os.open(path, flags)
+        prefix = "\n" if os.fstat(fd).st_size else ""
+    try:
+        _write_all(fd, (prefix + entry).encode("utf-8"))
+    finally:
+        os.close(fd)
 
 
 def main() -> int:
     args = parse_args()
     log_path = Path(args.log_path)
-    ensure_header(log_path)
+
+    from datetime import datetime
 
     timestamp = args.timestamp or datetime.now().replace(microsecond=0).isoformat()
     entry = build_entry(
@@ -133,10 +155,7 @@ def main() -> int:
         deferred_risks=args.deferred_risk,
     )
 
-    with log_path.open("a", encoding="utf-8") as f:
-        if log_path.stat().st_size > 0:
-            f.write("\n")
-        f.write(entry)
+    append_entry(log_path, entry)
 
     print(f"Appended decision entry to {log_path}")
     return 0
@@ -11,8 +11,12 @@ The snapshot captures:
 from __future__ import annotations
 
 import argparse
-from datetime import datetime
+import json
+import os
+import stat
+import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 
 DEFAULT_ARTIFACTS = [
@@ -26,6 +30,14 @@ DEFAULT_ARTIFACTS = [
     "stage6_hub_candidates_strict_capped_top50.csv",
 ]
 
+RECENT_DECISIONS = 12
+TAIL_CHUNK_BYTES = 64 * 1024
+CACHE_FILENAME = ".wgcna_snapshot_cache.json"
+
+HEADING_MARKER = b"## "
+APPROVED_MARKER = b"### Approved option"
+BULLET_MARKER = b"- "
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -60,11 +72,95 @@ def resolve_path(workspace: Path, path_like: str) -> Path:
     return path if path.is_absolute() else workspace / path
 
 
-def parse_decisions(log_path: Path) -> list[tuple[str, str, str]]:
+def _is_listed_artifact(st: os.stat_result) -> bool:
+    """Directories and non-empty regular files; zero-byte placeholders are skipped."""
+    return stat.S_ISDIR(st.st_mode) or (stat.S_ISREG(st.st_mode) and st.st_size > 0)
+
+
+def existing_artifacts(workspace: Path, artifacts: list[str]) -> list[str]:
+    """Return display paths of the listed artifacts, reading the workspace directory once.
+
+    Bare file names are matched against a single workspace listing (falling back
+    to os.stat for case variants of a listed name); other paths are checked
+    individually and shown relative to the workspace when inside it.
+    Only matched entries are stat'ed for their size (one stat call each on POSIX).
+    """
+    wanted = {a for a in artifacts if os.path.basename(a) == a and a not in (os.curdir, os.pardir)}
+    folded_wanted = {a.casefold() for a in wanted}
+    names: set[str] = set()
+    # Case variants of a wanted name; these may be the same file on a
+    # case-insensitive filesystem, so they are resolved with os.stat below.
+    other_case: set[str] = set()
+    if wanted:
+        with os.scandir(workspace) as entries:
+            for e in entries:
+                if e.name not in wanted:
+                    if e.name.casefold() in folded_wanted:
+                        other_case.add(e.name.casefold())
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                if _is_listed_artifact(st):
+                    names.add(e.name)
+
+    ws = str(workspace)
+    ws_prefix = os.path.join(ws, "")
+    found: list[str] = []
+    for a in artifacts:
+        if a in wanted:
+            if a in names:
+                found.append(a)
+                continue
+            if a.casefold() not in other_case:
+                continue
+        s = os.path.normpath(resolve_path(workspace, a))
+        try:
+            st = os.stat(s)
+        except OSError:
+            continue
+        if _is_listed_artifact(st):
+            if s == ws:
+                found.append(os.curdir)
+            else:
+                found.append(s[len(ws_prefix):] if s.startswith(ws_prefix) else s)
+    # Differently spelled requests for one artifact collapse to one display path.
+    return list(dict.fromkeys(found))
+
+
+def _tail_offset(f: BinaryIO, limit: int) -> int:
+    """Byte offset of the `limit`-th non-blank decision heading from the end (0 if fewer exist)."""
+    size = os.fstat(f.fileno()).st_size
+    chunk = TAIL_CHUNK_BYTES
+    while True:
+        start = max(0, size - chunk)
+        f.seek(start)
+        buf = f.read(size - start)
+        end = len(buf)
+        found = 0
+        while found < limit:
+            idx = buf.rfind(b"\n" + HEADING_MARKER, 0, end)
+            if idx < 0:
+                break
+            end = idx
+            # parse_decisions drops headings with a blank title, so they do not count.
+            title_start = idx + 1 + len(HEADING_MARKER)
+            title_end = buf.find(b"\n", title_start)
+            if buf[title_start:title_end if title_end >= 0 else len(buf)].decode("utf-8", "replace").strip():
+                found += 1
+        if found == limit:
+            return start + end + 1
+        if start == 0:
+            return 0
+        chunk *= 2
+
+
+def parse_decisions(log_path: Path, limit: int | None = None) -> list[tuple[str, str, str]]:
+    """Parse decisions from the log; with `limit`, only the tail holding the last `limit` is read."""
     if not log_path.exists():
         return []
 
-    lines = log_path.read_text(encoding="utf-8").splitlines()
     decisions: list[tuple[str, str, str]] = []
 
     current_heading = ""
@@ -72,23 +168,26 @@ def parse_decisions(log_path: Path) -> list[tuple[str, str, str]]:
     approved = ""
     capture_approved = False
 
-    for line in lines:
-        if line.startswith("## "):
-            if current_heading:
-                decisions.append((current_heading, current_stage, approved or "[not recorded]"))
-            current_heading = line[3:].strip()
-            current_stage = current_heading.split(" - ", 1)[1] if " - " in current_heading else current_heading
-            approved = ""
-            capture_approved = False
-            continue
+    with log_path.open("rb") as f:
+        f.seek(_tail_offset(f, limit) if limit else 0)
+        for line in f:
+            if line.startswith(HEADING_MARKER):
+                if current_heading:
+                    decisions.append((current_heading, current_stage, approved or "[not recorded]"))
+                current_heading = line[len(HEADING_MARKER):].decode("utf-8").strip()
+                current_stage = current_heading.split(" - ", 1)[1] if " - " in current_heading else current_heading
+                approved = ""
+                capture_approved = False
+                continue
 
-        if line.strip() == "### Approved option":
-            capture_approved = True
-            continue
+            stripped = line.strip()
+            if stripped == APPROVED_MARKER:
+                capture_approved = True
+                continue
 
-        if capture_approved and line.strip().startswith("- "):
-            approved = line.strip()[2:].strip()
-            capture_approved = False
+            if capture_approved and stripped.startswith(BULLET_MARKER):
+                approved = stripped[len(BULLET_MARKER):].decode("utf-8").strip()
+                capture_approved = False
 
     if current_heading:
         decisions.append((current_heading, current_stage, approved or "[not recorded]"))
@@ -96,14 +195,57 @@ def parse_decisions(log_path: Path) -> list[tuple[str, str, str]]:
     return decisions
 
 
+def load_decisions(log_path: Path, cache_path: Path, limit: int) -> list[tuple[str, str, str]]:
+    """Parse decisions, reusing the sidecar cache while the log is unchanged."""
+    try:
+        st = os.stat(log_path)
+    except FileNotFoundError:
+        return []
+    key = [str(log_path), st.st_mtime_ns, st.st_size, limit]
+
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            rows = cached["decisions"]
+            if all(isinstance(d, list) and len(d) == 3 and all(isinstance(v, str) for v in d) for d in rows):
+                return [tuple(d) for d in rows]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    decisions = parse_decisions(log_path, limit=limit)
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            prefix=cache_path.name + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_name = f.name
+            json.dump({"key": key, "decisions": decisions}, f)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    return decisions
+
+
 def render_snapshot(
     *,
     workspace: Path,
     output_path: Path,
     decision_log_path: Path,
     decisions: list[tuple[str, str, str]],
-    artifacts: list[Path],
+    artifacts: list[str],
 ) -> str:
+    from datetime import datetime
+
     now = datetime.now().replace(microsecond=0).isoformat()
     lines: list[str] = [
         "# WGCNA Resume Snapshot",
@@ -116,16 +258,15 @@ def render_snapshot(
     ]
 
     if decisions:
-        for _, stage, approved in decisions[-12:]:
+        for _, stage, approved in decisions[-RECENT_DECISIONS:]:
             lines.append(f"- `{stage}` -> {approved}")
     else:
         lines.append("- No parsed decisions found.")
 
     lines.extend(["", "## Available Artifacts"])
     if artifacts:
-        for p in artifacts:
-            rel = p.relative_to(workspace) if p.is_relative_to(workspace) else p
-            lines.append(f"- `{rel}`")
+        for name in artifacts:
+            lines.append(f"- `{name}`")
     else:
         lines.append("- No known artifacts found.")
 
@@ -144,26 +285,42 @@ def render_snapshot(
     return "\n".join(lines)
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_snapshot(path: Path, snapshot: str) -> None:
+    """Encode the snapshot once and write it directly to the file descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        _write_all(fd, snapshot.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 def main() -> int:
     args = parse_args()
     workspace = Path(args.workspace_dir).resolve()
-    workspace.mkdir(parents=True, exist_ok=True)
+    if not workspace.is_dir():
+        workspace.mkdir(parents=True, exist_ok=True)
 
     decision_log_path = resolve_path(workspace, args.decision_log).resolve()
     output_path = resolve_path(workspace, args.output_path).resolve()
 
-    candidate_artifacts = [resolve_path(workspace, p).resolve() for p in DEFAULT_ARTIFACTS + args.artifact]
-    existing_artifacts = [p for p in candidate_artifacts if p.exists()]
+    requested = list(dict.fromkeys(DEFAULT_ARTIFACTS + args.artifact))
+    artifacts = existing_artifacts(workspace, requested)
 
-    decisions = parse_decisions(decision_log_path)
+    decisions = load_decisions(decision_log_path, workspace / CACHE_FILENAME, RECENT_DECISIONS)
     snapshot = render_snapshot(
         workspace=workspace,
         output_path=output_path,
         decision_log_path=decision_log_path,
         decisions=decisions,
-        artifacts=existing_artifacts,
+        artifacts=artifacts,
     )
-    output_path.write_text(snapshot, encoding="utf-8")
+    write_snapshot(output_path, snapshot)
     print(f"Wrote resume snapshot to {output_path}")
     return 0
 